@@ -17,6 +17,11 @@ from homeassistant.data_entry_flow import FlowResult
 from .const import DOMAIN
 
 
+def _user_schema(devices: dict[str, str]) -> vol.Schema:
+    """Build the user-step schema for the given discovered devices."""
+    return vol.Schema({vol.Required(CONF_ADDRESS): vol.In(devices)})
+
+
 class RenphoConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for renpho."""
 
@@ -27,6 +32,7 @@ class RenphoConfigFlow(ConfigFlow, domain=DOMAIN):
         self._discovery_info: BluetoothServiceInfoBleak | None = None
         self._discovered_device: DeviceData | None = None
         self._discovered_devices: dict[str, str] = {}
+        self._device_name: str | None = None
         
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
@@ -45,15 +51,22 @@ class RenphoConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Confirm discovery."""
-        assert self._discovered_device is not None
+        if self._discovered_device is None or self._discovery_info is None:
+            return self.async_abort(reason="not_supported")
         device = self._discovered_device
-        assert self._discovery_info is not None
         discovery_info = self._discovery_info
-        title = device.title or device.get_device_name() or discovery_info.name
         if user_input is not None:
+            # Reuse the title computed when the form was shown.
+            title = (
+                self._device_name
+                or device.get_device_name()
+                or discovery_info.name
+            )
             return self.async_create_entry(title=title, data={})
 
         self._set_confirm_only()
+        title = device.title or device.get_device_name() or discovery_info.name
+        self._device_name = title
         placeholders = {"name": title}
         self.context["title_placeholders"] = placeholders
         return self.async_show_form(
@@ -72,13 +85,15 @@ class RenphoConfigFlow(ConfigFlow, domain=DOMAIN):
                 title=self._discovered_devices[address], data={}
             )
 
-        current_addresses = self._async_current_ids()
+        seen = set(self._async_current_ids())
+        seen.update(self._discovered_devices)
         for discovery_info in async_discovered_service_info(self.hass, False):
             address = discovery_info.address
-            if address in current_addresses or address in self._discovered_devices:
+            if address in seen:
                 continue
             device = DeviceData()
             if device.supported(discovery_info):
+                seen.add(address)
                 self._discovered_devices[address] = (
                     device.title or device.get_device_name() or discovery_info.name
                 )
@@ -88,7 +103,5 @@ class RenphoConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {vol.Required(CONF_ADDRESS): vol.In(self._discovered_devices)}
-            ),
+            data_schema=_user_schema(self._discovered_devices),
         )
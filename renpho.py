@@ -10,6 +10,7 @@ Updated on 2020-10-11 by bernstern <bernie@allthenticate.net>
 
 import asyncio
 import logging
+import struct
 import sys
 import binascii
 
@@ -19,14 +20,15 @@ from bleak.backends.scanner import AdvertisementData
 
 logger = logging.getLogger(__name__)
 
+_WEIGHT = struct.Struct("<H")
+
 
 def simple_callback(device: BLEDevice, advertisement_data: AdvertisementData):
-    
+
     if device.address == "ED:67:39:70:01:65":
-        
+
         advertisementBytes = device.details['props']['ManufacturerData'][65535]
-        subbytes=advertisementBytes[17:19]
-        int_val = int.from_bytes(subbytes, "little") / 100
+        int_val = _WEIGHT.unpack_from(advertisementBytes, 17)[0] / 100
         print("wieght: " + str(int_val))
        
      